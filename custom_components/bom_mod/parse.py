@@ -0,0 +1,65 @@
+"""Parsers for raw BOM (Bureau of Meteorology) products.
+
+These are kept free of Home Assistant imports so that process pool
+workers can load them cheaply.
+"""
+import io
+import re
+import zipfile
+import xml.etree.ElementTree
+
+
+def parse_forecast_xml(payload, aac):
+    """Return the forecast table for one area of a state precis product.
+
+    The full product covers every area in the state, but only the periods
+    for `aac` are kept, indexed by forecast day, so the result is small
+    enough to pass cheaply back from a pool worker.
+    """
+    root = xml.etree.ElementTree.fromstring(payload)
+    periods = {}
+    for period in root.iterfind(
+            "./forecast/area[@aac='{}']/forecast-period".format(aac)):
+        readings = {}
+        for reading in period.iterfind('./*[@type]'):
+            # keep the first match, as ElementTree.find() would
+            readings.setdefault(reading.get('type'), reading.text)
+        periods.setdefault(int(period.get('index')), {
+            'start_time': period.get('start-time-local'),
+            'readings': readings,
+        })
+    issue_time = root.find('./amoc/next-routine-issue-time-local')
+    return {
+        'next_issue_time': issue_time.text if issue_time is not None else None,
+        'periods': periods,
+    }
+
+
+def parse_bom_stations(stations_zip, observation_pages):
+    """Return {ZONE_ID.WMO_ID: (lat, lon)} from the raw BOM station payloads.
+
+    `stations_zip` is the content of stations.zip and `observation_pages`
+    the text of each state's *all.shtml observations page.
+    """
+    latlon = {}
+    with io.BytesIO(stations_zip) as file_obj:
+        with zipfile.ZipFile(file_obj) as zipped:
+            with zipped.open('stations.txt') as station_txt:
+                for _ in range(4):
+                    station_txt.readline()  # skip header
+                while True:
+                    line = station_txt.readline().decode().strip()
+                    if len(line) < 120:
+                        break  # end while loop, ignoring any footer text
+                    wmo, lat, lon = (line[a:b].strip() for a, b in
+                                     [(128, 134), (70, 78), (79, 88)])
+                    if wmo != '..':
+                        latlon[wmo] = (float(lat), float(lon))
+    zones = {}
+    pattern = (r'<a href="/products/(?P<zone>ID[A-Z]\d\d\d\d\d)/'
+               r'(?P=zone)\.(?P<wmo>\d\d\d\d\d).shtml">')
+    for page in observation_pages:
+        for zone_id, wmo_id in re.findall(pattern, page):
+            zones[wmo_id] = zone_id
+    return {'{}.{}'.format(zones[k], k): latlon[k]
+            for k in set(latlon) & set(zones)}
@@ -1,14 +1,15 @@
 """Support for Australian BOM (Bureau of Meteorology) weather service."""
+import concurrent.futures
 import datetime
 import ftplib
 import gzip
 import io
 import json
 import logging
+import multiprocessing
 import os
 import re
-import zipfile
-import xml.etree.ElementTree
+import threading
 
 import requests
 import voluptuous as vol
@@ -17,10 +18,12 @@ import homeassistant.helpers.config_validation as cv
 from homeassistant.components.sensor import PLATFORM_SCHEMA
 from homeassistant.const import (
     CONF_MONITORED_CONDITIONS, TEMP_CELSIUS, CONF_NAME, ATTR_ATTRIBUTION,
-    CONF_LATITUDE, CONF_LONGITUDE)
+    CONF_LATITUDE, CONF_LONGITUDE, EVENT_HOMEASSISTANT_STOP)
 from homeassistant.helpers.entity import Entity
 from homeassistant.util import Throttle
 
+from .parse import parse_bom_stations, parse_forecast_xml
+
 _RESOURCE = 'http://www.bom.gov.au/fwo/{}/{}.{}.json'
 _LOGGER = logging.getLogger(__name__)
 
@@ -35,10 +38,14 @@ ATTRIBUTION = "Data provided by the Australian Bureau of Meteorology"
 CONF_STATION = 'station'
 CONF_ZONE_ID = 'zone_id'
 CONF_WMO_ID = 'wmo_id'
+CONF_PARSE_IN_PROCESS_POOL = 'parse_in_process_pool'
 
 MIN_TIME_BETWEEN_UPDATES = datetime.timedelta(seconds=60)
 MIN_TIME_BETWEEN_FORECAST_UPDATES = datetime.timedelta(minutes=60)
 
+PARSE_POOL_WORKERS = 1
+PARSE_POOL_TIMEOUT = 60
+
 SENSOR_TYPES = {
     'wmo': ['wmo', None],
     'name': ['Station Name', None],
@@ -101,11 +108,15 @@ PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend({
     vol.Optional(CONF_STATION): validate_station,
     vol.Required(CONF_MONITORED_CONDITIONS, default=[]):
         vol.All(cv.ensure_list, [vol.In(SENSOR_TYPES)]),
+    vol.Optional(CONF_PARSE_IN_PROCESS_POOL, default=False): cv.boolean,
 })
 
 
 def setup_platform(hass, config, add_entities, discovery_info=None):
     """Set up the BOM sensor."""
+    if config[CONF_PARSE_IN_PROCESS_POOL]:
+        hass.bus.listen_once(EVENT_HOMEASSISTANT_STOP, shutdown_parse_pool)
+
     station = config.get(CONF_STATION)
     zone_id, wmo_id = config.get(CONF_ZONE_ID), config.get(CONF_WMO_ID)
 
@@ -119,7 +130,7 @@ def setup_platform(hass, config, add_entities, discovery_info=None):
     else:
         station = closest_station(
             config.get(CONF_LATITUDE), config.get(CONF_LONGITUDE),
-            hass.config.config_dir)
+            hass.config.config_dir, config[CONF_PARSE_IN_PROCESS_POOL])
         if station is None:
             _LOGGER.error("Could not get BOM weather station from lat/lon")
             return
@@ -266,19 +277,20 @@ class BOMCurrentData:
 class BOMForecastData:
     """Get data from BOM."""
 
-    def __init__(self, psProductID, psProductAAC, piForcastedDays):
+    def __init__(self, psProductID, psProductAAC, piForcastedDays,
+                 pbParseInProcessPool=False):
         """Initialize the data object."""
         self._ProductID = psProductID
         self._ProductAAC = psProductAAC
         self._ForcastedDays = piForcastedDays
+        self._ParseInProcessPool = pbParseInProcessPool
+        self._data = None
 
     def GetReading(self, pMonitoredCondition, piForecastDayIndex):
         """Return the value for the given condition."""
-       
-        find_query = ("./forecast/area[@aac='{}']/forecast-period[@index='{}']/*[@type='{}']".format(self._ProductAAC, piForecastDayIndex, pMonitoredCondition))
-        state = self._data.find(find_query)
-        if state is not None:
-            s = state.text
+        period = self._data['periods'].get(int(piForecastDayIndex))
+        if period is not None and pMonitoredCondition in period['readings']:
+            s = period['readings'][pMonitoredCondition]
             return (s[:251] + '...') if len(s) > 251 else s
         return ''
         
@@ -299,15 +311,15 @@ class BOMForecastData:
         
     def GetTimeProductIssued(self):
         """Return the issue time of forecast."""
-        issue_time = self._data.find("./amoc/next-routine-issue-time-local")
+        issue_time = self._data['next_issue_time']
         if issue_time is None:
             return 'n/a'
         else:
-            return issue_time.text
+            return issue_time
 
     def GetForcastPeriodStartTime(self, iForecastDayIndex):
         """Return the start time of forecast."""
-        return self._data.find("./forecast/area[@aac='{}']/forecast-period[@index='{}']".format(self._ProductAAC, iForecastDayIndex)).get("start-time-local")
+        return self._data['periods'][int(iForecastDayIndex)]['start_time']
     
     @Throttle(MIN_TIME_BETWEEN_FORECAST_UPDATES)
     def update(self):
@@ -317,49 +329,86 @@ class BOMForecastData:
         ftp.login()
         ftp.cwd('anon/gen/fwo/')
         ftp.retrbinary('RETR ' + self._ProductID + '.xml', file_obj.write)
-        file_obj.seek(0)
         ftp.quit()
-        tree = xml.etree.ElementTree.parse(file_obj)
-        self._data = tree.getroot()
+        self._data = _parse(
+            self._ParseInProcessPool, parse_forecast_xml,
+            file_obj.getvalue(), self._ProductAAC)
+
+
+_PARSE_POOL = None
+_PARSE_POOL_LOCK = threading.Lock()
+
+
+def _get_parse_pool():
+    """Return the process pool used for parsing, creating it if needed.
+
+    Workers are spawned rather than forked, as forking the multi-threaded
+    Home Assistant process is not safe.
+    """
+    global _PARSE_POOL
+    with _PARSE_POOL_LOCK:
+        if _PARSE_POOL is None:
+            _PARSE_POOL = concurrent.futures.ProcessPoolExecutor(
+                max_workers=PARSE_POOL_WORKERS,
+                mp_context=multiprocessing.get_context('spawn'))
+        return _PARSE_POOL
+
+
+def shutdown_parse_pool(event=None):
+    """Shut down the parse process pool, terminating any stuck worker."""
+    global _PARSE_POOL
+    with _PARSE_POOL_LOCK:
+        pool, _PARSE_POOL = _PARSE_POOL, None
+    if pool is None:
+        return
+    # ProcessPoolExecutor has no public way to stop a running task
+    for process in list((getattr(pool, '_processes', None) or {}).values()):
+        process.terminate()
+    pool.shutdown(wait=False)
+
+
+def _parse(in_process_pool, parser, *args):
+    """Run `parser` on raw BOM payloads, optionally in the process pool.
+
+    Parsing is pure-Python and holds the GIL, so offloading it keeps the
+    executor threads free when many products refresh together. A broken
+    or hung pool is shut down and the error raised; the next parse starts
+    a fresh pool.
+    """
+    if not in_process_pool:
+        return parser(*args)
+    try:
+        return _get_parse_pool().submit(parser, *args).result(
+            timeout=PARSE_POOL_TIMEOUT)
+    except (concurrent.futures.BrokenExecutor,
+            concurrent.futures.TimeoutError):
+        _LOGGER.error("BOM parse pool failed, shutting it down")
+        shutdown_parse_pool()
+        raise
+
 
-def _get_bom_stations():
+def _get_bom_stations(parse_in_process_pool=False):
     """Return {CONF_STATION: (lat, lon)} for all stations, for auto-config.
 
     This function does several MB of internet requests, so please use the
     caching version to minimise latency and hit-count.
     """
-    latlon = {}
     with io.BytesIO() as file_obj:
         with ftplib.FTP('ftp.bom.gov.au') as ftp:
             ftp.login()
             ftp.cwd('anon2/home/ncc/metadata/sitelists')
             ftp.retrbinary('RETR stations.zip', file_obj.write)
-        file_obj.seek(0)
-        with zipfile.ZipFile(file_obj) as zipped:
-            with zipped.open('stations.txt') as station_txt:
-                for _ in range(4):
-                    station_txt.readline()  # skip header
-                while True:
-                    line = station_txt.readline().decode().strip()
-                    if len(line) < 120:
-                        break  # end while loop, ignoring any footer text
-                    wmo, lat, lon = (line[a:b].strip() for a, b in
-                                     [(128, 134), (70, 78), (79, 88)])
-                    if wmo != '..':
-                        latlon[wmo] = (float(lat), float(lon))
-    zones = {}
-    pattern = (r'<a href="/products/(?P<zone>ID[A-Z]\d\d\d\d\d)/'
-               r'(?P=zone)\.(?P<wmo>\d\d\d\d\d).shtml">')
+        stations_zip = file_obj.getvalue()
+    observation_pages = []
     for state in ('nsw', 'vic', 'qld', 'wa', 'tas', 'nt'):
         url = 'http://www.bom.gov.au/{0}/observations/{0}all.shtml'.format(
             state)
-        for zone_id, wmo_id in re.findall(pattern, requests.get(url).text):
-            zones[wmo_id] = zone_id
-    return {'{}.{}'.format(zones[k], k): latlon[k]
-            for k in set(latlon) & set(zones)}
+        observation_pages.append(requests.get(url).text)
+    return _parse(parse_in_process_pool, parse_bom_stations,
+                  stations_zip, observation_pages)
 
 
-def bom_stations(cache_dir):
+def bom_stations(cache_dir, parse_in_process_pool=False):
     """Return {CONF_STATION: (lat, lon)} for all stations, for auto-config.
 
     Results from internet requests are cached as compressed JSON, making
@@ -367,7 +416,7 @@ def bom_stations(cache_dir):
     """
     cache_file = os.path.join(cache_dir, '.bom-stations.json.gz')
     if not os.path.isfile(cache_file):
-        stations = _get_bom_stations()
+        stations = _get_bom_stations(parse_in_process_pool)
         with gzip.open(cache_file, 'wt') as cache:
             json.dump(stations, cache, sort_keys=True)
         return stations
@@ -375,11 +424,11 @@ def bom_stations(cache_dir):
         return {k: tuple(v) for k, v in json.load(cache).items()}
 
 
-def closest_station(lat, lon, cache_dir):
+def closest_station(lat, lon, cache_dir, parse_in_process_pool=False):
     """Return the ZONE_ID.WMO_ID of the closest station to our lat/lon."""
     if lat is None or lon is None or not os.path.isdir(cache_dir):
         return
-    stations = bom_stations(cache_dir)
+    stations = bom_stations(cache_dir, parse_in_process_pool)
 
     def comparable_dist(wmo_id):
         """Create a psudeo-distance from latitude/longitude."""
@@ -5,13 +5,14 @@ import voluptuous as vol
 
 from homeassistant.components.weather import PLATFORM_SCHEMA, ATTR_FORECAST_CONDITION, ATTR_FORECAST_PRECIPITATION, ATTR_FORECAST_TEMP, ATTR_FORECAST_TEMP_LOW, ATTR_FORECAST_TIME, ATTR_WEATHER_VISIBILITY, WeatherEntity
 from homeassistant.const import (
-    CONF_LATITUDE, CONF_LONGITUDE, CONF_NAME, TEMP_CELSIUS)
+    CONF_LATITUDE, CONF_LONGITUDE, CONF_NAME, EVENT_HOMEASSISTANT_STOP,
+    TEMP_CELSIUS)
 from homeassistant.helpers import config_validation as cv
 from typing import Dict, List
 
 # Reuse data and API logic from the sensor implementation
 from .sensor import (
-    CONF_STATION, BOMCurrentData, BOMForecastData, closest_station, validate_station, validate_days)
+    CONF_STATION, CONF_PARSE_IN_PROCESS_POOL, BOMCurrentData, BOMForecastData, closest_station, shutdown_parse_pool, validate_station, validate_days)
     
 SENSOR_TYPES = {
     'max': ['air_temperature_maximum', 'Max Temp C', TEMP_CELSIUS, 'mdi:thermometer'],
@@ -51,14 +52,19 @@ PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend({
     vol.Optional(CONF_STATION): validate_station,
     vol.Optional(CONF_FORECAST_PRODUCT_ID): cv.string,
     vol.Optional(CONF_FORECAST_PRODUCT_AAC, default=''): cv.string,
+    vol.Optional(CONF_PARSE_IN_PROCESS_POOL, default=False): cv.boolean,
 })
 
 def setup_platform(hass, config, add_entities, discovery_info=None):
     """Set up the BOM weather platform."""
+    if config[CONF_PARSE_IN_PROCESS_POOL]:
+        hass.bus.listen_once(EVENT_HOMEASSISTANT_STOP, shutdown_parse_pool)
+
     station = config.get(CONF_STATION) or closest_station(
         config.get(CONF_LATITUDE),
         config.get(CONF_LONGITUDE),
-        hass.config.config_dir)
+        hass.config.config_dir,
+        config[CONF_PARSE_IN_PROCESS_POOL])
     if station is None:
         _LOGGER.error("Could not get BOM weather station from lat/lon")
         return False
@@ -68,7 +74,8 @@ def setup_platform(hass, config, add_entities, discovery_info=None):
     sProductAAC = config.get(CONF_FORECAST_PRODUCT_AAC)
 
     if sProductID is not None:
-        oBOMForecastData = BOMForecastData(sProductID, sProductAAC, iForcastedDays)
+        oBOMForecastData = BOMForecastData(sProductID, sProductAAC, iForcastedDays,
+                                           config[CONF_PARSE_IN_PROCESS_POOL])
         try:
             oBOMForecastData.update()
         except ValueError as err:
@@ -0,0 +1,97 @@
+"""Tests for the BOM product parsers."""
+import io
+import xml.etree.ElementTree
+import zipfile
+
+from custom_components.bom_mod.parse import (
+    parse_bom_stations, parse_forecast_xml)
+
+PRECIS_XML = b"""<?xml version="1.0"?>
+<product>
+  <amoc>
+    <next-routine-issue-time-local>2019-06-01T16:20:00+10:00</next-routine-issue-time-local>
+  </amoc>
+  <forecast>
+    <area aac="NSW_PW001" description="Sydney">
+      <forecast-period index="0" start-time-local="2019-06-01T05:00:00+10:00">
+        <element type="forecast_icon_code">3</element>
+        <element type="air_temperature_maximum">19</element>
+        <text type="precis">Partly cloudy.</text>
+        <text type="probability_of_precipitation">5%</text>
+      </forecast-period>
+      <forecast-period index="1" start-time-local="2019-06-02T00:00:00+10:00">
+        <element type="forecast_icon_code">12</element>
+        <element type="air_temperature_minimum">9</element>
+        <element type="air_temperature_maximum">17</element>
+        <text type="precis">Showers.</text>
+        <text type="precis">Duplicate, ignored.</text>
+      </forecast-period>
+    </area>
+    <area aac="NSW_PW002" description="Newcastle">
+      <forecast-period index="0" start-time-local="2019-06-01T06:00:00+10:00">
+        <element type="forecast_icon_code">1</element>
+      </forecast-period>
+    </area>
+  </forecast>
+</product>
+"""
+
+TYPES = ('forecast_icon_code', 'air_temperature_minimum',
+         'air_temperature_maximum', 'precis', 'probability_of_precipitation')
+
+
+def test_forecast_matches_xpath_lookups():
+    """Test the forecast table agrees with XPath queries on the product."""
+    root = xml.etree.ElementTree.fromstring(PRECIS_XML)
+    for aac in ('NSW_PW001', 'NSW_PW002', 'NSW_PW999'):
+        data = parse_forecast_xml(PRECIS_XML, aac)
+        assert data['next_issue_time'] == root.find(
+            './amoc/next-routine-issue-time-local').text
+        for index in range(3):
+            query = "./forecast/area[@aac='{}']/forecast-period[@index='{}']"
+            period = root.find(query.format(aac, index))
+            if period is None:
+                assert index not in data['periods']
+                continue
+            assert (data['periods'][index]['start_time']
+                    == period.get('start-time-local'))
+            for reading_type in TYPES:
+                reading = period.find("./*[@type='{}']".format(reading_type))
+                expected = reading.text if reading is not None else None
+                assert (data['periods'][index]['readings'].get(reading_type)
+                        == expected)
+
+
+def test_forecast_without_issue_time():
+    """Test a product with no amoc block."""
+    data = parse_forecast_xml(b'<product><forecast/></product>', 'NSW_PW001')
+    assert data == {'next_issue_time': None, 'periods': {}}
+
+
+def _station_line(wmo, lat, lon):
+    """Build a fixed-width stations.txt line, led by a site number."""
+    line = list(' ' * 140)
+    for start, value in ((0, '66037'), (70, lat), (79, lon), (128, wmo)):
+        line[start:start + len(value)] = value
+    return ''.join(line)
+
+
+def test_bom_stations():
+    """Test stations are joined across stations.txt and observation pages."""
+    lines = ['header'] * 4 + [
+        _station_line('94767', '-33.9465', '151.1731'),
+        _station_line('94768', '-33.8607', '151.2050'),
+        _station_line('..', '-30.0000', '150.0000'),
+        '',
+        'footer',
+    ]
+    file_obj = io.BytesIO()
+    with zipfile.ZipFile(file_obj, 'w') as zipped:
+        zipped.writestr('stations.txt', '\n'.join(lines))
+    pages = [
+        '<a href="/products/IDN60901/IDN60901.94767.shtml">Sydney Airport</a>',
+        '<a href="/products/IDV60901/IDV60901.95936.shtml">Melbourne</a>',
+    ]
+    assert parse_bom_stations(file_obj.getvalue(), pages) == {
+        'IDN60901.94767': (-33.9465, 151.1731),
+    }